@@ -1,8 +1,18 @@
+import hashlib
+import json
+import os
+
 import numpy as np
 import pandas as pd
 
-def gerar_dataset(n):
-    rng = np.random.default_rng()
+N_ROWS = 131072
+SEED = 0xC0FFEE
+
+CSV_FILE = f"dataset_{N_ROWS}.csv"
+META_FILE = f"dataset_{N_ROWS}.meta.json"
+
+def gerar_dataset(n, seed):
+    rng = np.random.default_rng(seed=seed)
 
     ids = np.arange(1, n + 1)
 
@@ -21,5 +31,30 @@ def gerar_dataset(n):
 
     return df
 
-df = gerar_dataset(131072)
-df.to_csv("dataset_131072.csv", index=False)
\ No newline at end of file
+def descrever_csv(path):
+    # Row count and content hash, so a truncated or hand-edited CSV is not reused
+    sha256 = hashlib.sha256()
+    rows = -1  # header line
+    with open(path, "rb") as f:
+        for line in f:
+            sha256.update(line)
+            rows += 1
+    return {"rows": rows, "sha256": sha256.hexdigest()}
+
+def dataset_atualizado(config):
+    # The CSV is only reused if it was generated with the same size and seed
+    # and still matches what was written at that time
+    if not (os.path.exists(CSV_FILE) and os.path.exists(META_FILE)):
+        return False
+    with open(META_FILE) as f:
+        meta = json.load(f)
+    return meta == {**config, **descrever_csv(CSV_FILE)}
+
+config = {"n": N_ROWS, "seed": SEED}
+
+if not dataset_atualizado(config):
+    df = gerar_dataset(N_ROWS, SEED)
+    df.to_csv(CSV_FILE, index=False)
+    with open(META_FILE, "w") as f:
+        json.dump({**config, **descrever_csv(CSV_FILE)}, f, indent=2)
+        f.write("\n")